@@ -35,6 +35,14 @@ class TranslationController:
             "max_tokens_per_chunk": 2000,
             "max_concurrent_requests": 35,
             "delay_between_requests_ms": 500,
+            # 공급자 분당 요청/토큰 한도 (0이면 제한 없음)
+            "requests_per_minute": 0,
+            "tokens_per_minute": 0,
+            # 출력 폴더의 .cache에 LLM 응답을 저장해 재실행 시 재사용 (선택 기능)
+            "use_llm_cache": False,
+            # 확정된 번역을 출력 폴더의 .cache에 저장해 다음 실행에서 재사용 (선택 기능,
+            # 사전/프롬프트 변경은 반영되지 않으므로 기본값은 꺼 둔다)
+            "use_translation_memory": False,
             "max_retries": 10,
             "use_glossary": True,
             "create_backup": True,
@@ -315,6 +323,18 @@ class TranslationController:
             max_quality_retries=self.settings["max_quality_retries"],
             selected_files=selected_files,
             selected_glossary_files=selected_glossary_files,
+            requests_per_minute=self.settings["requests_per_minute"],
+            tokens_per_minute=self.settings["tokens_per_minute"],
+            llm_cache_path=(
+                os.path.join(output_dir, ".cache", "llm_responses.sqlite")
+                if self.settings["use_llm_cache"]
+                else None
+            ),
+            translation_memory_path=(
+                os.path.join(output_dir, ".cache", "translation_memory.sqlite")
+                if self.settings["use_translation_memory"]
+                else None
+            ),
         )
 
     def _attempt_auto_registration(
@@ -485,6 +505,12 @@ class TranslationController:
         if self.settings["delay_between_requests_ms"] < 0:
             return False, "요청 간 지연은 0 이상이어야 합니다"
 
+        if (
+            self.settings["requests_per_minute"] < 0
+            or self.settings["tokens_per_minute"] < 0
+        ):
+            return False, "분당 요청/토큰 한도는 0 이상이어야 합니다"
+
         if not (0.0 <= self.settings["temperature"] <= 1.0):
             return False, "Temperature는 0.0과 1.0 사이여야 합니다"
 
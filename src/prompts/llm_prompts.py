@@ -4,6 +4,8 @@ Optimized for game localization workflow with GPT-5 best practices.
 """
 
 # Translation Prompt - Optimized for GPT-5
+# Static instructions come first and the per-chunk glossary/input last, so the
+# shared prefix can be reused by provider-side prompt caching.
 TRANSLATION_PROMPT_TEMPLATE = """<role>
 Expert translator specializing in game localization for sandbox and RPG genres.
 Task: Translate English text into natural {language} while maintaining game context.
@@ -43,14 +45,6 @@ Use TranslationResult tool with all translated items in one call.
 </step>
 </translation_workflow>
 
-<glossary>
-{glossary}
-</glossary>
-
-<input_text>
-{chunk}
-</input_text>
-
 <translation_guidelines>
 <quality_standards>
 - Accuracy: Preserve original meaning and game mechanics
@@ -88,7 +82,15 @@ TranslationResult accepts a list of TranslatedItem objects.
 Submit all translations in a single tool call for efficiency.
 Each item needs: id (string) and translated (string) fields.
 </tool_usage>
-</translation_guidelines>"""
+</translation_guidelines>
+
+<glossary>
+{glossary}
+</glossary>
+
+<input_text>
+{chunk}
+</input_text>"""
 
 # Retry Translation Prompt - Simplified for GPT-5
 RETRY_TRANSLATION_PROMPT_TEMPLATE = """<role>
@@ -125,14 +127,6 @@ Use TranslationResult tool with all corrected translations.
 </step>
 </retry_workflow>
 
-<glossary>
-{glossary}
-</glossary>
-
-<input_text>
-{chunk}
-</input_text>
-
 <retry_guidelines>
 <placeholder_verification>
 Placeholders are the most common failure point.
@@ -152,7 +146,15 @@ Only preserve placeholders like [P001], [NEWLINE], [S숫자] which are functiona
 Ensure all items from input are processed and submitted.
 The tool expects all translations in one call.
 </completeness_check>
-</retry_guidelines>"""
+</retry_guidelines>
+
+<glossary>
+{glossary}
+</glossary>
+
+<input_text>
+{chunk}
+</input_text>"""
 
 # Contextual Terms Extraction - Streamlined for GPT-5
 CONTEXTUAL_TERMS_PROMPT_TEMPLATE = """<role>
@@ -0,0 +1,210 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+__all__ = ["LLMResponseCache", "CachedLLMResponse", "TranslationMemory"]
+
+
+def _connect(path: Path) -> sqlite3.Connection:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(str(path), check_same_thread=False)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    return conn
+
+
+class CachedLLMResponse:
+    """캐시에서 복원했거나 복사한 LLM 응답 (`tool_calls`와 `content`만 제공)."""
+
+    def __init__(self, tool_calls: List[Dict[str, Any]], content: Any = ""):
+        self.tool_calls = tool_calls
+        self.content = content
+
+
+class LLMResponseCache:
+    """(모델, 대상 언어, 도구, 프롬프트) 해시로 도구 호출 결과를 저장하는 SQLite 캐시.
+
+    같은 프롬프트를 다시 실행할 때(부분 재실행, 반복 개발 등) LLM 호출을 생략한다.
+    sqlite3 호출은 `asyncio.to_thread`로 실행해 이벤트 루프를 막지 않는다.
+    """
+
+    def __init__(self, path: str | Path, max_rows: int = 100_000):
+        self.path = Path(path)
+        self.max_rows = max_rows
+        self.hits = 0
+        self.misses = 0
+        self._inserts_since_evict = 0
+        self._lock = threading.Lock()
+        self._conn = _connect(self.path)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key BLOB PRIMARY KEY, tool_calls TEXT NOT NULL, accessed_at REAL NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_responses_accessed ON responses(accessed_at)"
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(model: str, target_language: str, tool_name: str, prompt: str) -> bytes:
+        data = f"{model}|{target_language}|{tool_name}|{prompt}".encode("utf-8")
+        return hashlib.blake2b(data, digest_size=16).digest()
+
+    def _get(self, key: bytes) -> Optional[List[Dict[str, Any]]]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT tool_calls FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            # 최근 사용 시각 갱신 (LRU 정리 기준)
+            self._conn.execute(
+                "UPDATE responses SET accessed_at = ? WHERE key = ?",
+                (time.time(), key),
+            )
+            self._conn.commit()
+        return json.loads(row[0])
+
+    def _set(self, key: bytes, tool_calls: List[Dict[str, Any]]) -> None:
+        data = json.dumps(
+            [{"name": tc["name"], "args": tc["args"]} for tc in tool_calls],
+            ensure_ascii=False,
+        )
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, tool_calls, accessed_at) "
+                "VALUES (?, ?, ?)",
+                (key, data, time.time()),
+            )
+            self._inserts_since_evict += 1
+            # 매 삽입마다 COUNT를 하지 않도록 일정 간격으로만 정리
+            if self._inserts_since_evict >= 100:
+                self._inserts_since_evict = 0
+                self._conn.execute(
+                    "DELETE FROM responses WHERE key IN ("
+                    "SELECT key FROM responses ORDER BY accessed_at DESC "
+                    "LIMIT -1 OFFSET ?)",
+                    (self.max_rows,),
+                )
+            self._conn.commit()
+
+    async def get(self, key: bytes) -> Optional[List[Dict[str, Any]]]:
+        try:
+            result = await asyncio.to_thread(self._get, key)
+        except Exception as e:
+            logger.warning(f"LLM 응답 캐시 조회 실패: {e}")
+            return None
+        if result is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return result
+
+    async def set(self, key: bytes, tool_calls: List[Dict[str, Any]]) -> None:
+        try:
+            await asyncio.to_thread(self._set, key, tool_calls)
+        except Exception as e:
+            logger.warning(f"LLM 응답 캐시 저장 실패: {e}")
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class TranslationMemory:
+    """(모델, 대상 언어, 원문) 해시로 최종 번역을 저장하는 SQLite 번역 메모리.
+
+    실행이 끝날 때 검증을 통과한 번역을 저장해 두고, 다음 실행에서 같은 원문은
+    LLM에 보내지 않고 저장된 번역을 사용한다.
+    """
+
+    _BATCH = 500  # SQLite 변수 개수 제한을 넘지 않도록 IN 조회를 나누는 단위
+
+    def __init__(self, path: str | Path, max_rows: int = 500_000):
+        self.path = Path(path)
+        self.max_rows = max_rows
+        self._lock = threading.Lock()
+        self._conn = _connect(self.path)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS translations ("
+            "key BLOB PRIMARY KEY, translation TEXT NOT NULL, accessed_at REAL NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_translations_accessed "
+            "ON translations(accessed_at)"
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(model: str, target_language: str, source_text: str) -> bytes:
+        data = f"{model}|{target_language}|{source_text}".encode("utf-8")
+        return hashlib.blake2b(data, digest_size=16).digest()
+
+    def _get_many(self, keys: List[bytes]) -> Dict[bytes, str]:
+        found: Dict[bytes, str] = {}
+        with self._lock:
+            for i in range(0, len(keys), self._BATCH):
+                batch = keys[i : i + self._BATCH]
+                marks = ",".join("?" * len(batch))
+                found.update(
+                    self._conn.execute(
+                        "SELECT key, translation FROM translations "
+                        f"WHERE key IN ({marks})",
+                        batch,
+                    ).fetchall()
+                )
+            if found:
+                now = time.time()
+                self._conn.executemany(
+                    "UPDATE translations SET accessed_at = ? WHERE key = ?",
+                    [(now, key) for key in found],
+                )
+                self._conn.commit()
+        return found
+
+    def _set_many(self, entries: Dict[bytes, str]) -> None:
+        now = time.time()
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO translations (key, translation, accessed_at) "
+                "VALUES (?, ?, ?)",
+                [(key, translation, now) for key, translation in entries.items()],
+            )
+            self._conn.execute(
+                "DELETE FROM translations WHERE key IN ("
+                "SELECT key FROM translations ORDER BY accessed_at DESC "
+                "LIMIT -1 OFFSET ?)",
+                (self.max_rows,),
+            )
+            self._conn.commit()
+
+    async def get_many(self, keys: List[bytes]) -> Dict[bytes, str]:
+        if not keys:
+            return {}
+        try:
+            return await asyncio.to_thread(self._get_many, keys)
+        except Exception as e:
+            logger.warning(f"번역 메모리 조회 실패: {e}")
+            return {}
+
+    async def set_many(self, entries: Dict[bytes, str]) -> None:
+        if not entries:
+            return
+        try:
+            await asyncio.to_thread(self._set_many, entries)
+        except Exception as e:
+            logger.warning(f"번역 메모리 저장 실패: {e}")
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
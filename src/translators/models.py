@@ -1,9 +1,10 @@
 from __future__ import annotations
 
 import logging
+import sys
 from typing import Any, Dict, List, Optional, TypedDict
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
 logger = logging.getLogger(__name__)
 
@@ -30,15 +31,23 @@ class TranslatorState(TypedDict):
     max_tokens_per_chunk: int
     max_concurrent_requests: int
     delay_between_requests_ms: int
+    rate_limiter: Optional[Any]  # RPM/TPM 토큰 버킷 제한기 (RateLimiter)
+    llm_cache: Optional[Any]  # LLM 응답 디스크 캐시 (LLMResponseCache)
+    translation_memory: Optional[Any]  # 실행 간 원문 -> 번역 저장소 (TranslationMemory)
+    inflight_llm_calls: Dict[bytes, Any]  # 진행 중인 동일 LLM 요청 공유 (key -> Future)
+    bound_llm_cache: Dict[Any, Any]  # 도구가 바인딩된 LLM 재사용 (클라이언트, temperature, 스키마)
 
     placeholders: Dict[str, str]
     id_to_text_map: Dict[str, str]  # text_id -> original_text
+    id_to_tokens: Dict[str, int]  # text_id -> token count of original_text
     important_terms: List["GlossaryEntry"]  # Glossary for consistent translation
     processed_json: Dict[str, Any]  # text with IDs substituted JSON
     translation_map: Dict[str, str]  # text_id -> translated_text
+    translation_generation: int  # translation_map 변경 시 증가 (미번역 분류 캐시 무효화)
+    untranslated_cache: Dict[str, Any]  # 세대별 미번역 분류 결과 (should_retry와 노드가 공유)
 
     translated_json: Dict[str, Any]  # id replaced back with translated text
-    final_json: str
+    final_result: Dict[str, Any]  # placeholders restored, returned by translate()
 
     retry_count: int
     error: Optional[str]
@@ -85,6 +94,17 @@ class TermMeaning(BaseModel):
         description="A very concise snippet of the surrounding text (under 10 words) to differentiate its meaning",
     )
 
+    _normalized: str = PrivateAttr(default="")
+
+    def model_post_init(self, __context: Any) -> None:
+        # 중복 비교용 키를 생성 시 한 번만 계산 (intern으로 set 조회 가속)
+        self._normalized = sys.intern(self.translation.lower().strip())
+
+    @property
+    def normalized_translation(self) -> str:
+        """중복 비교에 사용하는 정규화된 번역 (소문자, 공백 제거)."""
+        return self._normalized
+
 
 class GlossaryEntry(BaseModel):
     """A glossary entry for a single original term, which may have multiple meanings."""
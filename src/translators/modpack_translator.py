@@ -13,6 +13,11 @@ from typing import Dict, List, Optional
 
 import aiofiles
 
+try:  # orjson은 선택 의존성 - 없으면 표준 json 사용
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
 from ..filters import ExtendedFilterManager
 from ..modpack.load import ModpackLoader
 from ..parsers.base import BaseParser
@@ -186,7 +191,8 @@ class ModpackTranslator:
             f for f in glossary_files if f.get("lang_type", "other") == "source"
         ]
 
-        self.glossary_text = ""
+        # 파일별 텍스트를 모아 두었다가 마지막에 한 번만 합친다 (반복 += 복사 방지)
+        glossary_parts: List[str] = []
 
         if len(glossary_source_files) != len(selected_glossary_files):
             logger.info(
@@ -218,8 +224,9 @@ class ModpackTranslator:
                         f"파일 처리 실패 ({Path(file_info['input']).name}): {result}"
                     )
                 elif result:
-                    self.glossary_text += "\n\n" + "\n".join(
-                        str(i.original_text) for i in result
+                    glossary_parts.append("\n\n")
+                    glossary_parts.append(
+                        "\n".join(str(i.original_text) for i in result)
                     )
 
             # 진행률 콜백 호출
@@ -232,6 +239,8 @@ class ModpackTranslator:
                     f"사전 데이터 추출: {processed_count}/{len(glossary_source_files)} 파일",
                 )
 
+        self.glossary_text = "".join(glossary_parts)
+
         # 3. 중복 제거 및 고유 엔트리만 남기기
         if self.progress_callback:
             self.progress_callback(
@@ -374,8 +383,17 @@ class ModpackTranslator:
         final_fallback_max_retries: int = 2,
         max_quality_retries: int = 1,
         selected_glossary_files: Optional[List[str]] = None,
+        requests_per_minute: Optional[int] = None,
+        tokens_per_minute: Optional[int] = None,
+        llm_cache_path: Optional[str] = None,
+        translation_memory_path: Optional[str] = None,
     ) -> Dict[str, str]:
-        """통합된 번역 데이터를 번역"""
+        """통합된 번역 데이터를 번역
+
+        `requests_per_minute`/`tokens_per_minute`는 공급자 RPM/TPM 한도 (None 또는 0이면 제한 없음).
+        `llm_cache_path`를 지정하면 LLM 응답을 SQLite 파일에 캐시해 재실행 시 재사용한다.
+        `translation_memory_path`를 지정하면 확정된 번역을 저장해 다음 실행에서 재사용한다.
+        """
         logger.info("통합 번역 데이터 번역 시작")
 
         if not self.integrated_data:
@@ -409,6 +427,10 @@ class ModpackTranslator:
             enable_quality_review=enable_quality_review,
             final_fallback_max_retries=final_fallback_max_retries,
             max_quality_retries=max_quality_retries,
+            requests_per_minute=requests_per_minute,
+            tokens_per_minute=tokens_per_minute,
+            llm_cache_path=llm_cache_path,
+            translation_memory_path=translation_memory_path,
         )
         # 결과가 문자열인 경우 JSON으로 파싱
         if isinstance(translated_result, str):
@@ -784,10 +806,22 @@ class ModpackTranslator:
             file_path_obj = Path(file_path)
             file_path_obj.parent.mkdir(parents=True, exist_ok=True)
 
+            # UTF-8 바이트로 바로 직렬화해 문자열 생성과 재인코딩을 생략
+            payload = None
+            if orjson is not None:
+                try:
+                    payload = orjson.dumps(
+                        data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+                    )
+                except (TypeError, orjson.JSONEncodeError) as e:
+                    # 64비트를 넘는 정수 등 orjson이 지원하지 않는 값은 표준 json으로 저장
+                    logger.debug(f"orjson 직렬화 실패, 표준 json 사용: {e}")
+            if payload is None:
+                payload = json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+
             # 비동기 파일 쓰기
-            async with aiofiles.open(file_path, "w", encoding="utf-8") as f:
-                json_str = json.dumps(data, ensure_ascii=False, indent=2)
-                await f.write(json_str)
+            async with aiofiles.open(file_path, "wb") as f:
+                await f.write(payload)
 
             logger.debug(f"JSON 파일 저장 완료: {file_path}")
         except Exception as e:
@@ -839,6 +873,10 @@ class ModpackTranslator:
         max_quality_retries: int = 1,
         selected_files: Optional[List[str]] = None,
         selected_glossary_files: Optional[List[str]] = None,
+        requests_per_minute: Optional[int] = None,
+        tokens_per_minute: Optional[int] = None,
+        llm_cache_path: Optional[str] = None,
+        translation_memory_path: Optional[str] = None,
     ) -> Dict[str, any]:
         """전체 번역 과정 실행 (최적화된 병렬 처리)"""
         try:
@@ -875,6 +913,10 @@ class ModpackTranslator:
                 final_fallback_max_retries=final_fallback_max_retries,
                 max_quality_retries=max_quality_retries,
                 selected_glossary_files=selected_glossary_files,
+                requests_per_minute=requests_per_minute,
+                tokens_per_minute=tokens_per_minute,
+                llm_cache_path=llm_cache_path,
+                translation_memory_path=translation_memory_path,
             )
 
             # 3. 결과 저장 (병렬 처리)
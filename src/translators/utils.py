@@ -1,21 +1,51 @@
 from __future__ import annotations
 
 import asyncio
+import functools
+import io
 import logging
+import os
+import threading
 import time
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 
 import regex as re
 
 from .models import GlossaryEntry, TermMeaning
 
+try:  # tiktoken은 선택 의존성 - 없으면 길이 기반 추정치 사용
+    import tiktoken
+except ImportError:  # pragma: no cover - optional dependency
+    tiktoken = None
+
 logger = logging.getLogger(__name__)
 
+# 줄바꿈(\r\n, \n, \r)을 한 번의 패스로 [NEWLINE]으로 치환하기 위한 정규식
+_NEWLINE_RE = re.compile(r"\r\n|\n|\r")
+
+# 플레이스홀더 패턴의 시작이 될 수 있는 문자 (없으면 패턴 검사 전체를 건너뜀)
+# - 서식/변수: § & % $ { [ <
+# - 아이템 코드(minecraft:stone, a.b): : .
+# - 줄바꿈, 연속 공백, 시작 공백
+_NEEDS_PLACEHOLDER_RE = re.compile(r"[§&%${\[<:.\r\n]| {2}|^\s")
+
+# 내부 플레이스홀더([P###], [NEWLINE], [S#])를 한 번의 스캔으로 세기 위한 정규식
+_INTERNAL_TOKEN_RE = re.compile(r"\[P\d{3,}\]|\[NEWLINE\]|\[S\d*\]")
+_INTERNAL_PLACEHOLDER_RE = re.compile(r"\[P\d{3,}\]")
+_INTERNAL_NEWLINE_RE = re.compile(r"\[NEWLINE\]")
+_INTERNAL_SPACE_RE = re.compile(r"\[S\d*\]")
+_LONG_SPACE_RE = re.compile(r" {2,}")
+_LEADING_SPACE_RE = re.compile(r"^\s+")
+_TEXT_ID_RE = re.compile(r"^T\d{3,}$")
+
 __all__ = [
     "RequestDelayManager",
+    "RateLimiter",
+    "AdaptiveConcurrencyLimiter",
     "PlaceholderManager",
     "TokenOptimizer",
     "is_korean_text",
+    "map_json_strings",
 ]
 
 
@@ -36,31 +66,239 @@ def is_korean_text(text: str) -> bool:
     return korean_ratio >= 0.3
 
 
+def map_json_strings(
+    obj: Any, func: Callable[[str], Any], *, share_unchanged: bool = False
+) -> Any:
+    """JSON 구조의 모든 문자열 값에 `func`를 적용한 새 객체를 반환한다.
+
+    재귀 대신 명시적 스택으로 순회해 깊은 JSON에서도 함수 호출 오버헤드와
+    재귀 한도 문제가 없다. 원본 객체는 변경하지 않는다.
+    `func`는 재귀 순회와 같은 전위 순서(문서 순서)로 호출되므로 번호를
+    매기는 함수(ID, 플레이스홀더 할당)에도 사용할 수 있다.
+    `share_unchanged=True`이면 바뀐 값이 없는 dict/list는 복사하지 않고 원본을
+    그대로 공유한다 (내부 중간 결과처럼 이후 변경되지 않는 객체에만 사용).
+    """
+    if share_unchanged:
+        return _map_json_strings_shared(obj, func)
+    if isinstance(obj, str):
+        return func(obj)
+    if isinstance(obj, dict):
+        root: Any = dict(obj)
+    elif isinstance(obj, list):
+        root = list(obj)
+    else:
+        return obj
+
+    # (컨테이너, 남은 항목 반복자) 스택: 자식을 만나면 내려갔다가 이어서 순회
+    stack = [(root, iter(root.items()) if type(root) is dict else enumerate(root))]
+    while stack:
+        node, items = stack[-1]
+        for key, value in items:
+            if isinstance(value, str):
+                node[key] = func(value)
+            elif isinstance(value, dict):
+                node[key] = child = dict(value)
+                stack.append((child, iter(child.items())))
+                break
+            elif isinstance(value, list):
+                node[key] = child = list(value)
+                stack.append((child, enumerate(child)))
+                break
+        else:
+            stack.pop()
+    return root
+
+
+def _map_json_strings_shared(obj: Any, func: Callable[[str], Any]) -> Any:
+    if isinstance(obj, str):
+        return func(obj)
+    if not isinstance(obj, (dict, list)):
+        return obj
+
+    # 전위 순서로 컨테이너를 모은 뒤 역순(자식 먼저)으로 처리한다
+    order = []
+    stack = [obj]
+    while stack:
+        node = stack.pop()
+        order.append(node)
+        for value in node.values() if isinstance(node, dict) else node:
+            if isinstance(value, (dict, list)):
+                stack.append(value)
+
+    results: Dict[int, Any] = {}
+    for node in reversed(order):
+        new_node = None
+        is_dict = isinstance(node, dict)
+        for key, value in node.items() if is_dict else enumerate(node):
+            if isinstance(value, str):
+                new_value = func(value)
+            elif isinstance(value, (dict, list)):
+                new_value = results[id(value)]
+            else:
+                continue
+            if new_value is not value:
+                # 실제로 바뀐 자식이 있을 때만 컨테이너를 복사
+                if new_node is None:
+                    new_node = dict(node) if is_dict else list(node)
+                new_node[key] = new_value
+        results[id(node)] = node if new_node is None else new_node
+    return results[id(obj)]
+
+
 class RequestDelayManager:
     """글로벌 요청 간격을 보장하는 비동기 딜레이 관리자.
 
     여러 코루틴이 동시에 API 요청을 시도해도 최소 `delay_ms` 만큼의 간격을 확보합니다.
     1) 각 요청 전에 `wait()` 를 호출합니다.
-    2) 내부에서 마지막 요청 시각을 체크해 부족한 시간을 `await asyncio.sleep()` 으로 채웁니다.
+    2) 다음 요청 시각(슬롯)을 먼저 예약한 뒤, 잠금 없이 그 시각까지 `await asyncio.sleep()` 합니다.
     """
 
     def __init__(self, delay_ms: int):
         self.delay_seconds = max(delay_ms / 1000.0, 0.0)
-        self._lock = asyncio.Lock()
-        self._last_request_time: float = 0.0
+        self._next_request_time: float = 0.0
 
     async def wait(self) -> None:  # noqa: D401 – imperative mood is fine
         """다음 요청까지 필요한 만큼 대기한다."""
         if self.delay_seconds <= 0:
             return
 
-        async with self._lock:
-            now = time.monotonic()
-            elapsed = now - self._last_request_time
-            if elapsed < self.delay_seconds:
-                await asyncio.sleep(self.delay_seconds - elapsed)
-            # 요청 직전 시간을 기록
-            self._last_request_time = time.monotonic()
+        # 슬롯 예약은 await 없이 처리되므로 이벤트 루프 안에서 원자적이다.
+        # 잠금을 쥔 채 잠들지 않아 대기 중인 코루틴들이 서로를 막지 않는다.
+        now = time.monotonic()
+        slot = max(now, self._next_request_time)
+        self._next_request_time = slot + self.delay_seconds
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+
+class RateLimiter:
+    """분당 요청 수(RPM)와 분당 토큰 수(TPM)를 함께 지키는 토큰 버킷 제한기.
+
+    고정 간격으로 쉬는 대신 남은 용량을 실시간으로 채워 두고, 용량이
+    부족할 때만 필요한 만큼 `asyncio.sleep()` 으로 기다린다. 한도가 지정되지
+    않은 항목(None 또는 0)은 제한하지 않는다.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: Optional[float] = None,
+        tokens_per_minute: Optional[float] = None,
+    ):
+        self.max_requests = float(requests_per_minute or 0)
+        self.max_tokens = float(tokens_per_minute or 0)
+        self.available_request_capacity = self.max_requests
+        self.available_token_capacity = self.max_tokens
+        self._last_update = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_requests > 0 or self.max_tokens > 0
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        elapsed = now - self._last_update
+        self._last_update = now
+        if self.max_requests:
+            self.available_request_capacity = min(
+                self.max_requests,
+                self.available_request_capacity + elapsed * self.max_requests / 60,
+            )
+        if self.max_tokens:
+            self.available_token_capacity = min(
+                self.max_tokens,
+                self.available_token_capacity + elapsed * self.max_tokens / 60,
+            )
+
+    async def acquire(self, tokens: int = 0) -> None:
+        """요청 1건과 `tokens` 만큼의 용량을 확보할 때까지 대기한다."""
+        if not self.enabled:
+            return
+
+        # 한 요청이 TPM 한도 자체를 넘으면 영원히 기다리게 되므로 한도로 자른다
+        if self.max_tokens:
+            tokens = min(tokens, self.max_tokens)
+
+        while True:
+            async with self._lock:
+                self._refill()
+                wait_time = 0.0
+                if self.max_requests and self.available_request_capacity < 1:
+                    wait_time = (
+                        (1 - self.available_request_capacity) * 60 / self.max_requests
+                    )
+                if self.max_tokens and self.available_token_capacity < tokens:
+                    wait_time = max(
+                        wait_time,
+                        (tokens - self.available_token_capacity)
+                        * 60
+                        / self.max_tokens,
+                    )
+                if wait_time <= 0:
+                    if self.max_requests:
+                        self.available_request_capacity -= 1
+                    if self.max_tokens:
+                        self.available_token_capacity -= tokens
+                    return
+            # 잠금을 풀고 기다려 다른 코루틴이 막히지 않도록 한다
+            await asyncio.sleep(wait_time)
+
+
+class AdaptiveConcurrencyLimiter:
+    """요청 결과에 따라 동시 요청 수를 조절하는 제한기 (AIMD 방식).
+
+    `asyncio.Semaphore` 대신 `async with` 로 사용한다. 속도 제한(429 등) 오류가
+    보고되면 한도를 절반으로 줄이고, 현재 한도만큼 연속으로 성공하면 1씩 늘린다.
+    한도는 `min_limit` ~ `max_limit` 범위를 벗어나지 않는다.
+    """
+
+    def __init__(
+        self, max_limit: int, min_limit: int = 1, decrease_cooldown: float = 1.0
+    ):
+        self.max_limit = max(1, max_limit)
+        self.min_limit = max(1, min(min_limit, self.max_limit))
+        self.limit = self.max_limit
+        self.decrease_cooldown = decrease_cooldown
+        self._in_flight = 0
+        self._successes = 0
+        self._last_decrease = float("-inf")
+        self._cond = asyncio.Condition()
+
+    async def __aenter__(self) -> "AdaptiveConcurrencyLimiter":
+        async with self._cond:
+            await self._cond.wait_for(lambda: self._in_flight < self.limit)
+            self._in_flight += 1
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> bool:
+        async with self._cond:
+            self._in_flight -= 1
+            self._cond.notify()
+        return False
+
+    async def record_success(self) -> None:
+        """성공한 요청을 기록하고, 충분히 안정적이면 한도를 1 늘린다."""
+        if self.limit >= self.max_limit:
+            return
+        self._successes += 1
+        if self._successes >= self.limit:
+            self._successes = 0
+            async with self._cond:
+                self.limit += 1
+                self._cond.notify_all()
+
+    async def record_rate_limit(self) -> None:
+        """속도 제한 오류를 기록하고 한도를 절반으로 줄인다."""
+        self._successes = 0
+        # 동시에 실패한 요청들이 한도를 연달아 깎지 않도록 잠시 동안은 한 번만 줄인다
+        now = time.monotonic()
+        if now - self._last_decrease < self.decrease_cooldown:
+            return
+        self._last_decrease = now
+        new_limit = max(self.min_limit, self.limit // 2)
+        if new_limit < self.limit:
+            logger.warning(f"속도 제한 감지: 동시 요청 수 {self.limit} -> {new_limit}")
+            self.limit = new_limit
 
 
 class PlaceholderManager:
@@ -108,29 +346,41 @@ class PlaceholderManager:
     _INTERNAL_NEWLINE_PATTERN = r"\[NEWLINE\]"
     _INTERNAL_SPACE_PATTERN = r"\[S\d*\]"
     _placeholder_counter = 0
+    # 스레드에서 추출할 때 [P###] 번호가 섞이지 않도록 카운터 사용을 직렬화
+    _counter_lock = threading.Lock()
 
     @staticmethod
     def reset_counter() -> None:
         PlaceholderManager._placeholder_counter = 0
 
+    @staticmethod
+    def extract_from_json(obj: Any) -> Tuple[Any, Dict[str, str]]:
+        """카운터를 리셋하고 JSON 전체의 플레이스홀더를 추출한다 (스레드 안전)."""
+        with PlaceholderManager._counter_lock:
+            PlaceholderManager.reset_counter()
+            placeholders: Dict[str, str] = {}
+            processed = PlaceholderManager.process_json_object(obj, placeholders)
+        return processed, placeholders
+
     @staticmethod
     def extract_special_patterns_from_value(
         text: str, placeholders: Dict[str, str]
     ) -> str:
         if not isinstance(text, str):
             return text
+        # 특수 문자가 없는 일반 문자열은 패턴 검사 없이 그대로 반환
+        if not _NEEDS_PLACEHOLDER_RE.search(text):
+            return text
 
         text = PlaceholderManager._extract_newlines(text, placeholders)
         text = PlaceholderManager._extract_spaces(text, placeholders)
 
         matches: List[str] = []
-        for pattern in PlaceholderManager._PLACEHOLDER_PATTERNS:
-            if pattern in [
-                PlaceholderManager.NEWLINE_PATTERN,
-                PlaceholderManager.LONG_SPACE_PATTERN,
-            ]:
+        for pattern, guard in _VALUE_PLACEHOLDER_RES:
+            # 패턴에 반드시 필요한 문자가 없으면 스캔하지 않는다
+            if guard and not any(ch in text for ch in guard):
                 continue
-            found_matches = re.findall(pattern, text)
+            found_matches = pattern.findall(text)
             for match in found_matches:
                 if isinstance(match, tuple):
                     match_str = next((g for g in match if g), match[0])
@@ -138,10 +388,8 @@ class PlaceholderManager:
                     match_str = match
                 matches.append(match_str)
 
-        seen: set[str] = set()
-        unique_matches = [m for m in matches if not (m in seen or seen.add(m))]
-
-        for match in unique_matches:
+        # 순서를 유지한 중복 제거
+        for match in dict.fromkeys(matches):
             PlaceholderManager._placeholder_counter += 1
             placeholder_id = f"[P{PlaceholderManager._placeholder_counter:03d}]"
             placeholders[placeholder_id] = match
@@ -155,10 +403,8 @@ class PlaceholderManager:
             return text
 
         newline_placeholder = "[NEWLINE]"
-        text = text.replace("\r\n", newline_placeholder)
-        text = text.replace("\n", newline_placeholder)
-        text = text.replace("\r", newline_placeholder)
-        if newline_placeholder in text:
+        text, count = _NEWLINE_RE.subn(newline_placeholder, text)
+        if count or newline_placeholder in text:
             placeholders[newline_placeholder] = "\n"
         return text
 
@@ -174,118 +420,76 @@ class PlaceholderManager:
             placeholders[space_key] = original_spaces
             return space_key
 
-        text = re.sub(r" {2,}", replace_space, text)
-        text = re.sub(r"^\s+", replace_space, text)
+        text = _LONG_SPACE_RE.sub(replace_space, text)
+        text = _LEADING_SPACE_RE.sub(replace_space, text)
         return text
 
     @staticmethod
     def process_json_object(obj: Any, placeholders: Dict[str, str]) -> Any:
-        if isinstance(obj, dict):
-            return {
-                k: PlaceholderManager.process_json_object(v, placeholders)
-                for k, v in obj.items()
-            }
-        if isinstance(obj, list):
-            return [
-                PlaceholderManager.process_json_object(i, placeholders) for i in obj
-            ]
-        if isinstance(obj, str):
-            return PlaceholderManager.extract_special_patterns_from_value(
-                obj, placeholders
-            )
-        return obj
+        extract = PlaceholderManager.extract_special_patterns_from_value
+        return map_json_strings(obj, lambda text: extract(text, placeholders))
 
     @staticmethod
     def restore_placeholders(text: str, placeholders: Dict[str, str]) -> str:  # noqa: D401
-        text = PlaceholderManager._restore_newlines(text, placeholders)
-        text = PlaceholderManager._restore_spaces(text, placeholders)
-        sorted_placeholders = sorted(
-            placeholders.items(),
-            key=lambda item: (int(item[0][2:-1]) if item[0].startswith("[P") else -1),
-            reverse=True,
-        )
-        for pid, original in sorted_placeholders:
-            if pid in ["[NEWLINE]"] or (pid.startswith("[S") and pid.endswith("]")):
-                continue
-            text = text.replace(pid, original)
-        return text
-
-    @staticmethod
-    def _restore_newlines(text: str, placeholders: Dict[str, str]) -> str:
-        if not isinstance(text, str):
-            return text
-        if "[NEWLINE]" in placeholders:
-            text = text.replace("[NEWLINE]", placeholders["[NEWLINE]"])
-        return text
-
-    @staticmethod
-    def _restore_spaces(text: str, placeholders: Dict[str, str]) -> str:
-        if not isinstance(text, str):
+        if not isinstance(text, str) or "[" not in text:
             return text
-        # [S숫자] 형태의 모든 공백 플레이스홀더를 복원
-        for placeholder_key, original_spaces in placeholders.items():
-            if placeholder_key.startswith("[S") and placeholder_key.endswith("]"):
-                text = text.replace(placeholder_key, original_spaces)
-        return text
-
-    @staticmethod
-    def _restore_placeholders_in_string(
-        text: str, sorted_placeholders: List[tuple[str, str]], newline_value: str | None
-    ) -> str:
-        if not isinstance(text, str):
-            return text
-        if newline_value and "[NEWLINE]" in text:
-            text = text.replace("[NEWLINE]", newline_value)
-        # [S숫자] 형태의 모든 공백 플레이스홀더를 복원
-        space_placeholders = {
-            k: v
-            for k, v in sorted_placeholders
-            if k.startswith("[S") and k.endswith("]")
-        }
-        for placeholder_key, original_spaces in space_placeholders.items():
-            if placeholder_key in text:
-                text = text.replace(placeholder_key, original_spaces)
-        for pid, original in sorted_placeholders:
-            if pid in text:
-                text = text.replace(pid, original)
-        return text
+        # 플레이스홀더 수만큼 replace를 반복하지 않고 한 번의 스캔으로 치환
+        table = PlaceholderManager._build_restore_table(
+            placeholders.items(), placeholders.get("[NEWLINE]")
+        )
+        return _INTERNAL_TOKEN_RE.sub(lambda m: table.get(m.group(0), m.group(0)), text)
 
     @staticmethod
     def restore_placeholders_in_json(
         json_obj: Any,
-        sorted_placeholders: List[tuple[str, str]],
+        placeholder_items: Iterable[tuple[str, str]],
         newline_value: str | None,
     ) -> Any:
-        if isinstance(json_obj, dict):
-            return {
-                k: PlaceholderManager.restore_placeholders_in_json(
-                    v, sorted_placeholders, newline_value
-                )
-                for k, v in json_obj.items()
-            }
-        elif isinstance(json_obj, (list, tuple)):
-            return [
-                PlaceholderManager.restore_placeholders_in_json(
-                    i, sorted_placeholders, newline_value
-                )
-                for i in json_obj
-            ]
-        elif isinstance(json_obj, str):
-            return PlaceholderManager._restore_placeholders_in_string(
-                text=json_obj,
-                sorted_placeholders=sorted_placeholders,
-                newline_value=newline_value,
+        """JSON의 모든 문자열에서 내부 플레이스홀더를 원래 값으로 복원한다.
+
+        플레이스홀더 키는 모두 [P###], [NEWLINE], [S#] 형태이므로 문자열마다
+        플레이스홀더 수만큼 `replace`를 반복하지 않고, 한 번의 정규식 스캔으로
+        찾은 토큰을 표에서 바로 치환한다. 치환표는 호출마다 한 번만 만든다.
+        """
+        table = PlaceholderManager._build_restore_table(
+            placeholder_items, newline_value
+        )
+
+        def restore(text: str) -> str:
+            if "[" not in text:
+                return text
+            return _INTERNAL_TOKEN_RE.sub(
+                lambda m: table.get(m.group(0), m.group(0)), text
             )
-        else:
-            return json_obj
+
+        return map_json_strings(json_obj, restore)
+
+    @staticmethod
+    def _build_restore_table(
+        items: Any, newline_value: str | None
+    ) -> Dict[str, str]:
+        """내부 토큰 -> 원래 값 치환표 (토큰 스캔 한 번으로 복원할 때 사용)."""
+        table = dict(items)
+        table.pop("[NEWLINE]", None)
+        # 기존 순차 치환과 동일하게, [P###] 값 안의 [S#]도 공백으로 복원해 둔다
+        space_table = {k: v for k, v in table.items() if k.startswith("[S")}
+        if space_table:
+            for key, value in table.items():
+                if key.startswith("[P") and "[S" in value:
+                    table[key] = _INTERNAL_TOKEN_RE.sub(
+                        lambda m: space_table.get(m.group(0), m.group(0)), value
+                    )
+        if newline_value:
+            table["[NEWLINE]"] = newline_value
+        return table
 
     @staticmethod
     def extract_placeholders_from_text(text: str) -> List[str]:
         if not isinstance(text, str):
             return []
         placeholders: List[str] = []
-        for pattern in PlaceholderManager._PLACEHOLDER_PATTERNS:
-            matches = re.findall(pattern, text)
+        for pattern in _PLACEHOLDER_RES:
+            matches = pattern.findall(text)
             for match in matches:
                 if isinstance(match, tuple):
                     match_str = next((g for g in match if g), match[0])
@@ -300,17 +504,18 @@ class PlaceholderManager:
         if not isinstance(original, str) or not isinstance(translated, str):
             return True
 
-        original_counts = PlaceholderManager._count_internal_placeholders(original)
-        translated_counts = PlaceholderManager._count_internal_placeholders(translated)
+        # 대부분의 원문에는 플레이스홀더가 없다: 번역에도 내부 토큰이 없으면 통과
+        if "[" not in original:
+            return "[" not in translated or not _INTERNAL_TOKEN_RE.search(translated)
 
-        return original_counts == translated_counts
+        return _placeholders_match(original, translated)
 
     @staticmethod
     def get_missing_placeholders(original: str, translated: str) -> List[str]:
         if not isinstance(original, str) or not isinstance(translated, str):
             return []
 
-        original_counts = PlaceholderManager._count_internal_placeholders(original)
+        original_counts = _count_original_placeholders(original)
         translated_counts = PlaceholderManager._count_internal_placeholders(translated)
 
         missing = []
@@ -327,42 +532,22 @@ class PlaceholderManager:
 
     @staticmethod
     def _count_internal_placeholders(text: str) -> Dict[str, int]:
-        if not isinstance(text, str):
+        if not isinstance(text, str) or "[" not in text:
             return {}
 
-        counts = {}
-        # Count [P###] placeholders
-        p_placeholders = re.findall(
-            PlaceholderManager._INTERNAL_PLACEHOLDER_PATTERN, text
-        )
-        for p in p_placeholders:
-            counts[p] = counts.get(p, 0) + 1
-
-        # Count [NEWLINE]
-        newline_count = len(
-            re.findall(PlaceholderManager._INTERNAL_NEWLINE_PATTERN, text)
-        )
-        if newline_count > 0:
-            counts["[NEWLINE]"] = newline_count
-
-        # Count [S숫자] - 각 고유한 [S숫자] 플레이스홀더를 개별적으로 카운팅
-        space_placeholders = re.findall(
-            PlaceholderManager._INTERNAL_SPACE_PATTERN, text
-        )
-        for space_placeholder in space_placeholders:
-            counts[space_placeholder] = counts.get(space_placeholder, 0) + 1
-
+        # [P###], [NEWLINE], [S숫자]를 한 번에 찾아 각 플레이스홀더별로 카운팅
+        counts: Dict[str, int] = {}
+        for token in _INTERNAL_TOKEN_RE.findall(text):
+            counts[token] = counts.get(token, 0) + 1
         return counts
 
     @staticmethod
     def _extract_internal_placeholders(text: str) -> List[str]:
         if not isinstance(text, str):
             return []
-        placeholders = re.findall(
-            PlaceholderManager._INTERNAL_PLACEHOLDER_PATTERN, text
-        )
-        newlines = re.findall(PlaceholderManager._INTERNAL_NEWLINE_PATTERN, text)
-        spaces = re.findall(PlaceholderManager._INTERNAL_SPACE_PATTERN, text)
+        placeholders = _INTERNAL_PLACEHOLDER_RE.findall(text)
+        newlines = _INTERNAL_NEWLINE_RE.findall(text)
+        spaces = _INTERNAL_SPACE_RE.findall(text)
         return placeholders + newlines + spaces
 
     @staticmethod
@@ -372,16 +557,14 @@ class PlaceholderManager:
             return False
 
         text = text.strip()
-        if not text:
+        # 플레이스홀더는 모두 '['로 시작하므로 없으면 바로 판단
+        if not text or "[" not in text:
             return False
 
         # 모든 내부 placeholder를 제거
-        temp_text = text
-        temp_text = re.sub(
-            PlaceholderManager._INTERNAL_PLACEHOLDER_PATTERN, "", temp_text
-        )
-        temp_text = re.sub(PlaceholderManager._INTERNAL_NEWLINE_PATTERN, "", temp_text)
-        temp_text = re.sub(PlaceholderManager._INTERNAL_SPACE_PATTERN, "", temp_text)
+        temp_text = _INTERNAL_PLACEHOLDER_RE.sub("", text)
+        temp_text = _INTERNAL_NEWLINE_RE.sub("", temp_text)
+        temp_text = _INTERNAL_SPACE_RE.sub("", temp_text)
 
         # 모든 placeholder가 제거된 후 남은 텍스트가 있는지 확인
         remaining_text = temp_text.strip()
@@ -389,42 +572,128 @@ class PlaceholderManager:
         return len(remaining_text) == 0
 
 
+# 문자열마다 패턴을 다시 조회/컴파일하지 않도록 미리 컴파일 (목록 순서 유지)
+_PLACEHOLDER_RES = [re.compile(p) for p in PlaceholderManager._PLACEHOLDER_PATTERNS]
+# 각 패턴이 매칭되려면 반드시 포함해야 하는 문자 (하나도 없으면 스캔 생략)
+_PATTERN_GUARD_CHARS: Dict[str, str] = {
+    PlaceholderManager.IMAGE_PLACEHOLDER_PATTERN: "{",
+    PlaceholderManager.PAGEBREAK_PATTERN: "{",
+    PlaceholderManager.JSON_PLACEHOLDER_PATTERN: "{[",
+    PlaceholderManager.C_PLACEHOLDER_PATTERN: "%",
+    PlaceholderManager.FORMAT_CODE_PATTERN: "§&",
+    PlaceholderManager.ITEM_PLACEHOLDER_PATTERN: "$",
+    PlaceholderManager.HTML_TAG_PATTERN: "<",
+    PlaceholderManager.MINECRAFT_ITEM_CODE_PATTERN: ":.",
+    PlaceholderManager.JS_TEMPLATE_LITERAL_PATTERN: "$",
+    PlaceholderManager.SQUARE_BRACKET_TAG_PATTERN: "[",
+    PlaceholderManager.LEGACY_MINECRAFT_PATTERN: "%",
+    r"\{\{[^}]+\}\}": "{",
+}
+# 값 추출에서는 줄바꿈/공백을 전용 치환으로 먼저 처리하므로 두 패턴을 제외
+_VALUE_PLACEHOLDER_RES: List[Tuple[Any, str]] = [
+    (re.compile(p), _PATTERN_GUARD_CHARS.get(p, ""))
+    for p in PlaceholderManager._PLACEHOLDER_PATTERNS
+    if p
+    not in (PlaceholderManager.NEWLINE_PATTERN, PlaceholderManager.LONG_SPACE_PATTERN)
+]
+
+
+@functools.lru_cache(maxsize=65536)
+def _count_original_placeholders(text: str) -> Dict[str, int]:
+    """원문의 플레이스홀더 개수 (원문은 검증 중 여러 번 비교되므로 캐시한다).
+
+    반환된 dict는 캐시에 공유되므로 수정하지 않는다.
+    """
+    return PlaceholderManager._count_internal_placeholders(text)
+
+
+@functools.lru_cache(maxsize=8192)
+def _placeholders_match(original: str, translated: str) -> bool:
+    """원문/번역의 플레이스홀더 개수 비교 (재시도 중 같은 쌍은 다시 세지 않는다)."""
+    translated_counts = PlaceholderManager._count_internal_placeholders(translated)
+    return _count_original_placeholders(original) == translated_counts
+
+
 class TokenOptimizer:
     """Helpers for ID substitution and token-count heuristics."""
 
     _id_counter = 0
+    _encoding: Any = None
+    _encoding_unavailable = False
 
     @staticmethod
     def reset_id_counter() -> None:
         TokenOptimizer._id_counter = 0
 
+    @staticmethod
+    def _get_encoding() -> Any:
+        """tiktoken 인코딩을 한 번만 로드한다 (실패 시 None)."""
+        if TokenOptimizer._encoding is None and not (
+            tiktoken is None or TokenOptimizer._encoding_unavailable
+        ):
+            try:
+                TokenOptimizer._encoding = tiktoken.get_encoding("cl100k_base")
+            except Exception as exc:
+                # 오프라인 환경 등에서 인코딩 파일을 받지 못한 경우
+                TokenOptimizer._encoding_unavailable = True
+                logger.debug(f"tiktoken 인코딩 로드 실패, 추정치 사용: {exc}")
+        return TokenOptimizer._encoding
+
+    @staticmethod
+    def count_tokens(text: str) -> int:
+        """텍스트 하나의 토큰 수 (tiktoken이 없으면 길이 기반 추정치)."""
+        encoding = TokenOptimizer._get_encoding()
+        if encoding is not None:
+            try:
+                return len(encoding.encode(text, disallowed_special=()))
+            except Exception as exc:
+                logger.debug(f"tiktoken 인코딩 실패, 추정치 사용: {exc}")
+        return len(text) // 4 + 1
+
+    @staticmethod
+    def count_tokens_batch(texts: List[str]) -> List[int]:
+        """여러 텍스트의 토큰 수를 한 번에 계산한다.
+
+        tiktoken을 사용할 수 있으면 배치 인코딩으로 실제 토큰 수를 구하고,
+        그렇지 않으면 `estimate_tokens`와 같은 길이 기반 추정치를 반환한다.
+        """
+        encoding = TokenOptimizer._get_encoding()
+        if encoding is not None:
+            try:
+                encoded = encoding.encode_batch(
+                    texts, num_threads=os.cpu_count() or 1, disallowed_special=()
+                )
+                return [len(tokens) for tokens in encoded]
+            except Exception as exc:
+                logger.debug(f"tiktoken 배치 인코딩 실패, 추정치 사용: {exc}")
+        return [len(text) // 4 + 1 for text in texts]
+
     @staticmethod
     def format_chunk_for_llm(chunk: List[Dict[str, str]]) -> str:
         if not chunk:
             return "No translation items provided."
 
-        lines = [f"=== TRANSLATION TEXTS ({len(chunk)} items) ==="]
-        lines.append("")
+        buf = io.StringIO()
+        w = buf.write
+        w(f"=== TRANSLATION TEXTS ({len(chunk)} items) ===\n\n")
 
         for i, item in enumerate(chunk, 1):
             text_id = item.get("id", f"item_{i}")
             original_text = item.get("original", "")
+            w(f"Item {i}: ID [{text_id}]\nOriginal text:\n{original_text}\n\n")
 
-            lines.append(f"Item {i}: ID [{text_id}]")
-            lines.append("Original text:")
-            lines.append(original_text)
-            lines.append("")
-
-        return "\n".join(lines)
+        # 기존 "\n".join 결과와 같도록 마지막 줄바꿈 하나를 제거
+        return buf.getvalue()[:-1]
 
     @staticmethod
     def format_glossary_for_llm(glossary_entries: List[GlossaryEntry]) -> str:
         if not glossary_entries:
             return "No glossary terms available."
 
-        lines = [f"=== GLOSSARY TERMS ({len(glossary_entries)} entries) ==="]
-        lines.append("Use these terms consistently in your translations:")
-        lines.append("")
+        buf = io.StringIO()
+        w = buf.write
+        w(f"=== GLOSSARY TERMS ({len(glossary_entries)} entries) ===\n")
+        w("Use these terms consistently in your translations:\n\n")
 
         for i, entry in enumerate(glossary_entries, 1):
             original = entry.original
@@ -439,11 +708,10 @@ class TokenOptimizer:
                     meanings.append(f"'{translation}'")
 
             meanings_str = " OR ".join(meanings)
-            lines.append(f"{i}. '{original}' → {meanings_str}")
+            w(f"{i}. '{original}' → {meanings_str}\n")
 
-        lines.append("")
-        lines.append("Note: Choose the most appropriate translation based on context.")
-        return "\n".join(lines)
+        w("\nNote: Choose the most appropriate translation based on context.")
+        return buf.getvalue()
 
     @staticmethod
     def deduplicate_glossary_meanings(meanings: List[TermMeaning]) -> List[TermMeaning]:
@@ -453,7 +721,7 @@ class TokenOptimizer:
         seen_translations = set()
         deduplicated: List[TermMeaning] = []
         for meaning in meanings:
-            translation_key = meaning.translation.lower().strip()
+            translation_key = meaning.normalized_translation
             if translation_key not in seen_translations:
                 seen_translations.add(translation_key)
                 deduplicated.append(meaning)
@@ -468,97 +736,118 @@ class TokenOptimizer:
     def merge_glossary_entry_meanings(
         existing_meanings: List[TermMeaning], new_meanings: List[TermMeaning]
     ) -> List[TermMeaning]:
-        existing_translations = {
-            meaning.translation.lower().strip() for meaning in existing_meanings
-        }
-        merged_meanings = existing_meanings.copy()
-        for new_meaning in new_meanings:
-            translation_key = new_meaning.translation.lower().strip()
-            if translation_key not in existing_translations:
-                merged_meanings.append(new_meaning)
-                existing_translations.add(translation_key)
-        return TokenOptimizer.deduplicate_glossary_meanings(merged_meanings)
+        # 기존 의미 중복 제거와 새 의미 병합을 한 번의 순회로 처리
+        return TokenOptimizer.deduplicate_glossary_meanings(
+            [*existing_meanings, *new_meanings]
+        )
+
+    @staticmethod
+    def replace_text_with_ids(
+        json_obj: Any,
+        id_map: Dict[str, str],
+        text_to_id: Optional[Dict[str, str]] = None,
+        counter: Optional[Iterator[int]] = None,
+    ) -> Any:
+        """문자열을 ID로 치환한다. 동일한 문자열은 같은 ID를 재사용한다.
+
+        `counter`를 넘기면 클래스 공용 카운터 대신 그 번호로 ID를 만든다.
+        """
+        if text_to_id is None:
+            text_to_id = {}
+
+        def replace(text: str) -> str:
+            if not text.strip():
+                return text
+            # 이미 ID가 할당된 동일 문자열이면 기존 ID 재사용
+            if text in text_to_id:
+                return text_to_id[text]
+            return TokenOptimizer._assign_text_id(text, id_map, text_to_id, counter)
+
+        return map_json_strings(json_obj, replace)
 
     @staticmethod
-    def replace_text_with_ids(json_obj: Any, id_map: Dict[str, str]) -> Any:
-        if isinstance(json_obj, dict):
-            return {
-                k: TokenOptimizer.replace_text_with_ids(v, id_map)
-                for k, v in json_obj.items()
-            }
-        if isinstance(json_obj, list):
-            return [TokenOptimizer.replace_text_with_ids(i, id_map) for i in json_obj]
-        if isinstance(json_obj, str) and json_obj.strip():
+    def _assign_text_id(
+        text: str,
+        id_map: Dict[str, str],
+        text_to_id: Dict[str, str],
+        counter: Optional[Iterator[int]] = None,
+    ) -> str:
+        if counter is None:
             TokenOptimizer._id_counter += 1
-            text_id = f"T{TokenOptimizer._id_counter:03d}"
-            id_map[text_id] = json_obj
-            return text_id
-        return json_obj
+            number = TokenOptimizer._id_counter
+        else:
+            number = next(counter)
+        text_id = f"T{number:03d}"
+        id_map[text_id] = text
+        text_to_id[text] = text_id
+        return text_id
 
     @staticmethod
     def replace_text_with_ids_selective(
-        json_obj: Any, id_map: Dict[str, str], existing_translations: Dict[str, str]
+        json_obj: Any,
+        id_map: Dict[str, str],
+        existing_translations: Dict[str, str],
+        text_to_id: Optional[Dict[str, str]] = None,
+        counter: Optional[Iterator[int]] = None,
     ) -> Any:
-        """기존 번역이 있는 항목은 번역으로 직접 대체하고, 없는 항목만 ID로 처리"""
-        if isinstance(json_obj, dict):
-            return {
-                k: TokenOptimizer.replace_text_with_ids_selective(
-                    v, id_map, existing_translations
-                )
-                for k, v in json_obj.items()
-            }
-        if isinstance(json_obj, list):
-            return [
-                TokenOptimizer.replace_text_with_ids_selective(
-                    i, id_map, existing_translations
-                )
-                for i in json_obj
-            ]
-        if isinstance(json_obj, str) and json_obj.strip():
-            text = json_obj.strip()
+        """기존 번역이 있는 항목은 번역으로 직접 대체하고, 없는 항목만 ID로 처리
+
+        동일한 원문은 하나의 ID를 공유하므로 LLM에는 한 번만 전달된다.
+        `counter`를 넘기면 클래스 공용 카운터 대신 그 번호로 ID를 만든다.
+        """
+        if text_to_id is None:
+            text_to_id = {}
+
+        def replace(value: str) -> str:
+            text = value.strip()
+            if not text:
+                return value
 
             # placeholder만으로 구성된 텍스트는 번역하지 않음
             if PlaceholderManager.is_placeholder_only(text):
                 logger.debug(f"Placeholder만으로 구성된 텍스트 건너뛰기: '{text}'")
-                return json_obj
+                return value
 
             # 이미 한글로 번역된 텍스트인지 확인
             if is_korean_text(text):
                 # 이미 한글 텍스트면 그대로 반환 (번역 불필요)
-                return json_obj
+                return value
 
             # 이미 번역된 항목이 있는지 체크
             if text in existing_translations:
                 # 이미 번역된 텍스트가 있으면 해당 번역을 직접 반환
                 return existing_translations[text]
+            elif value in text_to_id:
+                # 같은 원문이 이미 ID를 받았으면 재사용 (중복 번역 방지)
+                return text_to_id[value]
             else:
                 # 번역이 없으면 ID로 처리 (번역 대상)
-                TokenOptimizer._id_counter += 1
-                text_id = f"T{TokenOptimizer._id_counter:03d}"
-                id_map[text_id] = json_obj
-                return text_id
-        return json_obj
+                return TokenOptimizer._assign_text_id(
+                    value, id_map, text_to_id, counter
+                )
+
+        return map_json_strings(json_obj, replace)
 
     @staticmethod
     def optimize_json_for_translation(data: Dict[str, Any]) -> List[str]:
-        texts: List[str] = []
-
-        def collect(obj: Any) -> None:
+        # 문서 순서를 유지하며 중복을 제거 (재귀 없이 명시적 스택으로 순회,
+        # 스택은 뒤에서부터 꺼내므로 자식을 역순으로 넣는다)
+        texts: Dict[str, None] = {}
+        stack = [data]
+        while stack:
+            obj = stack.pop()
             if isinstance(obj, dict):
-                for v in obj.values():
-                    collect(v)
+                stack.extend(reversed(obj.values()))
             elif isinstance(obj, list):
-                for i in obj:
-                    collect(i)
-            elif isinstance(obj, str) and obj.strip():
+                stack.extend(reversed(obj))
+            elif isinstance(obj, str) and obj not in texts and obj.strip():
                 # ID 패턴(T###)과 placeholder만으로 구성된 텍스트 제외
-                if not re.match(
-                    r"^T\d{3,}$", obj
-                ) and not PlaceholderManager.is_placeholder_only(obj):
-                    texts.append(obj)
-
-        collect(data)
-        return list(set(texts))
+                # (첫 글자가 "T"일 때만 정규식을 실행, placeholder 검사는 "[" 없으면 즉시 종료)
+                if obj[0] == "T" and _TEXT_ID_RE.match(obj):
+                    continue
+                if not PlaceholderManager.is_placeholder_only(obj):
+                    texts[obj] = None
+        return list(texts)
 
     @staticmethod
     def estimate_tokens(text: str) -> int:
@@ -566,15 +855,29 @@ class TokenOptimizer:
 
     @staticmethod
     def create_text_chunks(
-        items: List[Dict[str, str]], max_tokens_per_chunk: int = 3000
+        items: List[Dict[str, str]],
+        max_tokens_per_chunk: int = 3000,
+        token_counts: Optional[Dict[str, int]] = None,
     ) -> List[List[Dict[str, str]]]:
+        """항목들을 토큰 한도에 맞춰 청크로 나눈다.
+
+        `token_counts`(ID -> 토큰 수)가 주어지면 미리 계산된 값을 사용하고,
+        없는 항목만 길이 기반으로 추정한다.
+        """
         chunks: List[List[Dict[str, str]]] = []
         current_chunk: List[Dict[str, str]] = []
         current_tokens = 0
         prompt_overhead = 500
         effective_max = max_tokens_per_chunk - prompt_overhead
-        for item in items:
-            text_tokens = TokenOptimizer.estimate_tokens(item["original"])
+        # 토큰 수를 한 번에 미리 계산해 루프 안의 함수 호출을 없앤다
+        if token_counts:
+            item_tokens = [
+                token_counts.get(item.get("id")) or len(item["original"]) // 4 + 1
+                for item in items
+            ]
+        else:
+            item_tokens = [len(item["original"]) // 4 + 1 for item in items]
+        for item, text_tokens in zip(items, item_tokens):
             if text_tokens > effective_max:
                 if current_chunk:
                     chunks.append(current_chunk)
@@ -594,7 +897,7 @@ class TokenOptimizer:
 
     @staticmethod
     def handle_oversized_text(text: str, max_tokens: int) -> str:  # noqa: D401
-        tokens = TokenOptimizer.estimate_tokens(text)
+        tokens = len(text) // 4 + 1
         if tokens > max_tokens:
             logger.warning(
                 "⚠️  Single text contains %s tokens, exceeding limit (%s).",